@@ -1,7 +1,14 @@
+import os
 import streamlit as st
 
-SUPABASE_URL = st.secrets["SUPABASE"]["URL"]
-SUPABASE_KEY = st.secrets["SUPABASE"]["KEY"]
+
+def _setting(name):
+    # Environment variables win so offline tools can point the client elsewhere
+    return os.environ.get(f"SUPABASE_{name}") or st.secrets["SUPABASE"][name]
+
+
+SUPABASE_URL = _setting("URL")
+SUPABASE_KEY = _setting("KEY")
 TABLE_NAME = "Volleyball_events"
 
 HEADERS = {
@@ -1,14 +1,19 @@
+import pandas as pd
 import streamlit as st
 
-from ui.layout import setup_page
-from utils.helpers import horizontal_radio
-from utils.constants import EVENT_OUTCOMES, PLAYERS
+from ui.layout import setup_page, render_sync_status, render_report_job
+from utils.helpers import horizontal_radio, allowed_outcomes, validate_event
+from utils.constants import ATTACK_TYPES, PLAYERS, SET_TO
 from services.supabase_service import (
-    save_event, load_events, update_event, delete_event
+    save_event, save_events, update_event, delete_event
 )
+from services.events_refresher import session_refresher
 from services.export_service import (
-    export_all_events_excel,
-    export_player_excel
+    build_events_excel,
+    build_player_excel
+)
+from services.report_jobs import (
+    PRIORITY_CURRENT_GAME, PRIORITY_DEFAULT, data_fingerprint, scheduler
 )
 
 
@@ -50,31 +55,26 @@ set_to = None
 if event == "Attack":
     attack_type = horizontal_radio(
         "### ⚡ Attack Type",
-        ["", "Free Ball", "Tip", "Hole", "Spike"],
+        [""] + ATTACK_TYPES,
         "attack_type"
     )
 
 elif event == "Set":
     set_to = horizontal_radio(
         "### 🧱 Set To",
-        ["", "Position 1", "Position 2", "Position 3", "Position 4", "Position 6"],
+        [""] + SET_TO,
         "set_to"
     )
 
 # ---------------- OUTCOME ----------------
-base_outcomes = EVENT_OUTCOMES.get(event, [])
-
 # Reset outcome if attack type changes
 if event == "Attack" and attack_type:
     if st.session_state.get("last_attack_type") != attack_type:
         st.session_state.selected_outcome = ""
     st.session_state.last_attack_type = attack_type
 
-# Add spike-specific outcomes
-if event == "Attack" and attack_type == "Spike":
-    outcome_options = base_outcomes + ["Hard Blocked", "Soft Blocked"]
-else:
-    outcome_options = base_outcomes
+# Includes spike-specific outcomes
+outcome_options = allowed_outcomes(event, attack_type)
 
 outcome = (
     horizontal_radio(
@@ -86,7 +86,76 @@ outcome = (
 )
 
 # ---------------- SAVE EVENT ----------------
-if st.button("💾 Save Event", use_container_width=True):
+new_event = {
+    "player": player,
+    "event": event,
+    "attack_type": attack_type if event == "Attack" else None,
+    "set_to": set_to if event == "Set" else None,
+    "outcome": outcome,
+    "game_name": st.session_state.game_name or "No Game Entered",
+    "set_number": st.session_state.set_number,
+    "video_url": st.session_state.video_url
+}
+
+rapid_mode = st.toggle(
+    "⚡ Rapid-tag mode",
+    key="rapid_mode",
+    help="Collect a whole rally locally and save it with a single request"
+)
+
+rally = st.session_state.rally_buffer
+
+if rapid_mode:
+    if st.button("➕ Add to Rally", use_container_width=True):
+        problems = validate_event(new_event)
+        if problems:
+            st.warning(f"Invalid: {', '.join(problems)}")
+        else:
+            rally.append(new_event)
+
+# Keep an unsaved rally on screen after the mode is switched off, so it can't
+# silently end up in the next rally
+if rapid_mode or rally:
+    # Callbacks run before the script, so the disabled states below see the change
+    col_undo, col_discard, col_save = st.columns(3)
+    col_undo.button(
+        "↩️ Undo Last",
+        on_click=rally.pop,
+        disabled=not rally,
+        use_container_width=True
+    )
+    col_discard.button(
+        "🗑️ Discard Rally",
+        on_click=rally.clear,
+        disabled=not rally,
+        use_container_width=True
+    )
+
+    if col_save.button(
+        f"✅ End Rally & Save ({len(rally)})",
+        disabled=not rally,
+        use_container_width=True
+    ):
+        if save_events(rally).ok:
+            rally.clear()
+            st.session_state.reload_events = True
+            st.rerun()
+        else:
+            st.error("❌ Failed to save rally (Supabase error)")
+
+    if rally:
+        if not rapid_mode:
+            st.warning(
+                f"⚠️ {len(rally)} unsaved rally event(s) from rapid-tag mode — "
+                "save or discard them"
+            )
+        st.dataframe(
+            pd.DataFrame(rally)[["player", "event", "attack_type", "set_to", "outcome"]],
+            hide_index=True,
+            use_container_width=True
+        )
+
+if not rapid_mode and st.button("💾 Save Event", use_container_width=True):
     missing = []
     if not player:
         missing.append("player")
@@ -98,16 +167,7 @@ if st.button("💾 Save Event", use_container_width=True):
     if missing:
         st.warning(f"Missing: {', '.join(missing)}")
     else:
-        success = save_event({
-            "player": player,
-            "event": event,
-            "attack_type": attack_type if event == "Attack" else None,
-            "set_to": set_to if event == "Set" else None,
-            "outcome": outcome,
-            "game_name": st.session_state.game_name or "No Game Entered",
-            "set_number": st.session_state.set_number,
-            "video_url": st.session_state.video_url
-        })
+        success = save_event(new_event)
 
         if success:
             st.success("✅ Event saved!")
@@ -121,13 +181,16 @@ if st.button("💾 Save Event", use_container_width=True):
 st.divider()
 st.subheader("📋 Logged Events")
 
-# Load events into session_state if not already loaded or if refresh is needed
-if "df_events" not in st.session_state or st.session_state.get("reload_events", False):
-    st.session_state.df_events = load_events()
-    st.session_state.reload_events = False
+refresher = session_refresher()
+render_sync_status(refresher)
 
 df = st.session_state.df_events
 
+# Failures from the last Save All Changes / Delete, shown once after its rerun
+editor_error = st.session_state.pop("editor_error", None)
+if editor_error:
+    st.error(editor_error)
+
 if not df.empty:
     # Sort rows by timestamp or id
     sort_col = "timestamp" if "timestamp" in df.columns else "id"
@@ -166,6 +229,7 @@ if not df.empty:
 
     # ----- Save edits -----
     if st.button("💾 Save All Changes", use_container_width=True):
+        failed = {}
         for _, row in edited_df.iterrows():
             original = df.loc[df["id"] == row["id"]].iloc[0]
             changes = {
@@ -174,9 +238,18 @@ if not df.empty:
                 if col in row and row[col] != original[col]
             }
             if changes:
-                update_event(row["id"], changes)
-
-        st.success("✅ All edits saved!")
+                r = update_event(row["id"], changes)
+                if not r.ok:
+                    failed[row["id"]] = r.text
+
+        if failed:
+            # Kept in session state so it survives the rerun below
+            st.session_state.editor_error = (
+                f"❌ Failed to save edits to rows {', '.join(map(str, failed))}: "
+                f"{next(iter(failed.values()))}"
+            )
+        else:
+            st.success("✅ All edits saved!")
         # Mark to reload fresh data
         st.session_state.reload_events = True
         st.rerun()
@@ -185,16 +258,38 @@ if not df.empty:
     delete_ids = edited_df.loc[edited_df["Delete?"], "id"].tolist()
     if delete_ids:
         if st.button("🗑️ Delete Selected Rows", use_container_width=True):
+            failed = {}
             for row_id in delete_ids:
-                delete_event(row_id)
-            st.success("🗑️ Rows deleted")
+                r = delete_event(row_id)
+                if not r.ok:
+                    failed[row_id] = r.text
+
+            if failed:
+                st.session_state.editor_error = (
+                    f"❌ Failed to delete rows {', '.join(map(str, failed))}: "
+                    f"{next(iter(failed.values()))}"
+                )
+            else:
+                st.success("🗑️ Rows deleted")
             st.session_state.reload_events = True
             st.rerun()
 
     # ---------------- EXPORTS ----------------
+    # Reports are built by the shared background scheduler; identical requests
+    # from several coaches collapse into one job
+    report_jobs = st.session_state.report_jobs
+
     st.divider()
     st.subheader("📤 Export Data")
-    export_all_events_excel(df)
+    if st.button("📦 Prepare All Events Excel", use_container_width=True):
+        report_jobs["all_events"] = scheduler.submit(
+            ("all_events", data_fingerprint(df)),
+            build_events_excel,
+            df,
+            file_name="volleyball_events.xlsx"
+        )
+    if "all_events" in report_jobs:
+        render_report_job(report_jobs["all_events"], "⬇️ Download All Events (Excel)")
 
     st.divider()
     st.subheader("📊 Player Statistics Export")
@@ -202,9 +297,26 @@ if not df.empty:
         "Select player",
         sorted(df["player"].dropna().unique())
     )
-
-    if st.button("⬇️ Download Player Excel Report", use_container_width=True):
-        export_player_excel(df, player_for_export)
+    current_game = st.session_state.game_name
+    # A disabled checkbox keeps its last value, so ignore it without a game name
+    current_game_only = st.checkbox(
+        f"Only current game ({current_game or 'no game entered'})",
+        disabled=not current_game,
+        key="report_current_game_only"
+    ) and bool(current_game)
+
+    if st.button("📦 Prepare Player Excel Report", use_container_width=True):
+        report_df = df[df["game_name"] == current_game] if current_game_only else df
+        report_jobs["player"] = scheduler.submit(
+            ("player", player_for_export, data_fingerprint(report_df)),
+            build_player_excel,
+            report_df,
+            player_for_export,
+            priority=PRIORITY_CURRENT_GAME if current_game_only else PRIORITY_DEFAULT,
+            file_name=f"{player_for_export}_volleyball_report.xlsx"
+        )
+    if "player" in report_jobs:
+        render_report_job(report_jobs["player"], "⬇️ Download Player Excel Report")
 
 else:
     st.info("No events logged yet.")
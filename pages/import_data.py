@@ -0,0 +1,56 @@
+import streamlit as st
+
+from ui.layout import setup_page
+from services.import_service import import_events
+
+
+# ---------------- PAGE SETUP ----------------
+setup_page()
+st.title("📥 Import Historical Data")
+st.caption(
+    "CSV or Excel with columns player, event, outcome and optionally attack_type, "
+    "set_to, game_name, set_number, video_url, notes. Outcome names from the old "
+    "dashboard are mapped automatically."
+)
+
+uploaded = st.file_uploader("Scouting file", type=["csv", "xlsx"])
+
+if uploaded and st.button("⬆️ Import", use_container_width=True):
+    status = st.empty()
+
+    def show_progress(result):
+        status.info(f"⏳ {result.inserted} events inserted…")
+
+    with st.spinner("Importing…"):
+        result = import_events(uploaded, uploaded.name, progress=show_progress)
+
+    status.empty()
+    st.session_state.reload_events = True
+    st.session_state.last_import = result
+
+result = st.session_state.get("last_import")
+if result:
+    rejected = result.rejected_df
+    if result.read_error:
+        # Spreadsheet row of the last row read: 1-based plus the header line
+        st.error(
+            f"❌ {result.inserted} events inserted, then stopped after row "
+            f"{result.rows_read + 1}: {result.read_error}. Rows after it were not "
+            "imported — import only the remaining rows to avoid duplicates."
+        )
+    else:
+        st.success(f"✅ {result.inserted} events imported")
+
+    for count, error in result.failed_batches:
+        st.error(f"❌ Batch of {count} events failed: {error}")
+
+    if not rejected.empty:
+        st.warning(f"⚠️ {len(rejected)} rows rejected")
+        st.dataframe(rejected, hide_index=True, use_container_width=True)
+        st.download_button(
+            "⬇️ Download Rejected Rows (CSV)",
+            rejected.to_csv(index=False).encode("utf-8-sig"),
+            file_name="rejected_rows.csv",
+            mime="text/csv",
+            use_container_width=True
+        )
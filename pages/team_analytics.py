@@ -0,0 +1,76 @@
+import altair as alt
+import streamlit as st
+
+from ui.layout import setup_page, render_sync_status
+from services.analytics_service import METRIC_COLUMNS, team_analytics
+from services.events_refresher import session_refresher
+
+
+# ---------------- PAGE SETUP ----------------
+setup_page()
+st.title("📊 Team Analytics")
+
+refresher = session_refresher()
+render_sync_status(refresher)
+
+# Recompute only when a new version of the events table has landed
+cached = st.session_state.get("team_analytics")
+if cached is None or cached[0] != refresher.version:
+    cached = (refresher.version, team_analytics(refresher.df))
+    st.session_state.team_analytics = cached
+
+summary, trends = cached[1]
+
+if summary.empty:
+    st.info("No events logged yet.")
+    st.stop()
+
+# ---------------- TEAM OVERVIEW ----------------
+st.subheader("🏐 Efficiency by Player and Category")
+st.caption("Efficiency % = (points won − errors) / attempts")
+st.dataframe(
+    summary["Efficiency %"].unstack("category"),
+    use_container_width=True
+)
+
+# ---------------- CATEGORY DETAIL ----------------
+st.divider()
+categories = sorted(summary.index.get_level_values("category").unique())
+category = st.selectbox("🎯 Category", categories)
+
+st.dataframe(
+    summary.xs(category, level="category"),
+    use_container_width=True,
+    column_config={
+        "Point %": st.column_config.NumberColumn(help="Aces / kills per attempt"),
+        "Quality Index": st.column_config.NumberColumn(
+            help="0–100, weighted by outcome order (categories with a defined order only)"
+        )
+    }
+)
+
+# ---------------- PER-GAME TRENDS ----------------
+st.divider()
+st.subheader("📈 Per-Game Trend")
+metric = st.radio(
+    "Metric",
+    [c for c in METRIC_COLUMNS if c != "Attempts"],
+    horizontal=True,
+    key="trend_metric"
+)
+
+category_trends = trends.xs(category, level="category")
+games = category_trends.index.get_level_values("game_name").unique()
+points = category_trends[metric].rename("value").dropna().reset_index()
+
+if not points.empty:
+    # Explicit sort keeps games in tagging order; Vega-Lite would sort them by name
+    chart = alt.Chart(points).mark_line(point=True).encode(
+        x=alt.X("game_name:N", sort=list(games), title="Game"),
+        y=alt.Y("value:Q", title=metric),
+        color=alt.Color("player:N", title="Player"),
+        tooltip=["player", "game_name", alt.Tooltip("value:Q", title=metric)]
+    )
+    st.altair_chart(chart, use_container_width=True)
+else:
+    st.info(f"No {metric} data for {category}.")
@@ -0,0 +1,88 @@
+import pandas as pd
+
+from utils.constants import ERROR_OUTCOMES, OUTCOME_ORDER, POINT_OUTCOMES
+
+
+METRIC_COLUMNS = ["Attempts", "Point %", "Error %", "Efficiency %", "Quality Index"]
+
+# (category, outcome) -> flag / weight lookups, built once at import
+_POINT_PAIRS = {(cat, o) for cat, outcomes in POINT_OUTCOMES.items() for o in outcomes}
+_ERROR_PAIRS = {(cat, o) for cat, outcomes in ERROR_OUTCOMES.items() for o in outcomes}
+# Best outcome in OUTCOME_ORDER scores 1, worst scores 0
+_QUALITY_WEIGHTS = {
+    (cat, o): (len(order) - 1 - i) / (len(order) - 1)
+    for cat, order in OUTCOME_ORDER.items()
+    for i, o in enumerate(order)
+}
+
+
+# Returns (summary, trends) with METRIC_COLUMNS: summary indexed by (player, category),
+# trends by (player, category, game_name) with games in the order they were first tagged.
+# Events are counted once per (player, category, game, outcome) and every metric is
+# derived from those counts, so the whole team costs a single groupby.
+def team_analytics(df):
+    if df.empty or not {"player", "event", "outcome"} <= set(df.columns):
+        return _empty(["player", "category"]), _empty(["player", "category", "game_name"])
+
+    events = pd.DataFrame({
+        "player": df["player"],
+        "category": df["event"].str.split("(").str[0].str.strip(),
+        "game_name": (
+            df["game_name"].fillna("No Game Entered")
+            if "game_name" in df.columns else "No Game Entered"
+        ),
+        "outcome": df["outcome"]
+    }).dropna(subset=["player", "category", "outcome"])
+
+    counts = (
+        events.groupby(["player", "category", "game_name", "outcome"], sort=False)
+        .size()
+        .rename("n")
+        .reset_index()
+    )
+
+    pairs = pd.MultiIndex.from_frame(counts[["category", "outcome"]])
+    weights = pd.Series(pairs.map(_QUALITY_WEIGHTS.get), index=counts.index, dtype="float")
+    counts["points"] = counts["n"] * pairs.isin(_POINT_PAIRS)
+    counts["errors"] = counts["n"] * pairs.isin(_ERROR_PAIRS)
+    counts["quality"] = (counts["n"] * weights).fillna(0)
+    counts["rated"] = counts["n"] * weights.notna()
+
+    totals = ["n", "points", "errors", "quality", "rated"]
+    per_game = counts.groupby(["player", "category", "game_name"], sort=False)[totals].sum()
+    per_player = per_game.groupby(level=["player", "category"]).sum()
+
+    trends = _rates(per_game)
+    order = _game_order(df)
+    if order is not None:
+        trends = trends.sort_index(
+            level="game_name",
+            key=lambda games: games.map(order),
+            sort_remaining=False
+        )
+
+    return _rates(per_player).sort_index(), trends
+
+
+def _rates(totals):
+    n = totals["n"]
+    return pd.DataFrame({
+        "Attempts": n,
+        "Point %": (totals["points"] / n * 100).round(1),
+        "Error %": (totals["errors"] / n * 100).round(1),
+        "Efficiency %": ((totals["points"] - totals["errors"]) / n * 100).round(1),
+        "Quality Index": (totals["quality"] / totals["rated"].where(totals["rated"] > 0) * 100).round(1)
+    }, index=totals.index)
+
+
+def _game_order(df):
+    # Games in the order they were first tagged
+    if "id" not in df.columns or "game_name" not in df.columns:
+        return None
+    first_ids = df.groupby(df["game_name"].fillna("No Game Entered"))["id"].min()
+    return first_ids.rank(method="first")
+
+
+def _empty(index_names):
+    index = pd.MultiIndex.from_arrays([[]] * len(index_names), names=index_names)
+    return pd.DataFrame(columns=METRIC_COLUMNS, index=index)
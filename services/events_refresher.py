@@ -0,0 +1,75 @@
+import threading
+import time
+
+import requests
+import streamlit as st
+
+from services.supabase_service import fetch_events, load_events
+
+
+class EventsRefresher:
+    """Serves the cached events frame while a fresh copy loads on a background thread."""
+
+    def __init__(self, df):
+        self._lock = threading.Lock()
+        self._running = False
+        self._pending = False
+        self.df = df
+        self.version = 0
+        self.synced_at = time.time()
+        self.error = None
+
+    @property
+    def refreshing(self):
+        return self._running
+
+    def refresh(self):
+        with self._lock:
+            if self._running:
+                # A save landed after the running fetch started; fetch again when it ends
+                self._pending = True
+                return
+            self._running = True
+            threading.Thread(target=self._run, daemon=True).start()
+
+    def seconds_since_sync(self):
+        return int(time.time() - self.synced_at)
+
+    def _run(self):
+        while True:
+            try:
+                df, error = fetch_events()
+            except requests.RequestException as e:
+                df, error = None, str(e)
+
+            with self._lock:
+                # Keep serving the old frame rather than swapping in a partial one
+                if error:
+                    self.error = error
+                else:
+                    self.df = df
+                    self.error = None
+                    self.synced_at = time.time()
+                    self.version += 1
+
+                if not self._pending:
+                    self._running = False
+                    return
+                self._pending = False
+
+
+def session_refresher():
+    # First load is blocking (nothing cached yet); later reloads refresh in the
+    # background while the cached frame keeps being served
+    if "events_refresher" not in st.session_state:
+        st.session_state.events_refresher = EventsRefresher(load_events())
+        st.session_state.reload_events = False
+
+    refresher = st.session_state.events_refresher
+    if st.session_state.get("reload_events", False):
+        refresher.refresh()
+        st.session_state.reload_events = False
+
+    st.session_state.df_events = refresher.df
+    st.session_state.events_version = refresher.version
+    return refresher
@@ -1,25 +1,26 @@
 import pandas as pd
-import matplotlib.pyplot as plt
+import matplotlib
+from matplotlib.figure import Figure
 from io import BytesIO
 from utils.helpers import rtl
+from openpyxl import Workbook
 from openpyxl.drawing.image import Image as XLImage
 from openpyxl.utils import get_column_letter
 
-import streamlit as st
-
 from utils.helpers import extract_category
 from utils.constants import OUTCOME_ORDER
 
+# Set once at import: report workers run concurrently and must not touch
+# global matplotlib state
+matplotlib.rcParams["font.family"] = "DejaVu Sans"  # Hebrew-safe font
 
-from utils.helpers import extract_category
-from utils.constants import OUTCOME_ORDER
-
-def export_player_excel(df: pd.DataFrame, player_name: str):
+# Streamlit-free, so report jobs can run it on a worker thread.
+# Returns None when the player has no events.
+def build_player_excel(df: pd.DataFrame, player_name: str, output_path: str):
     player_df = _prepare_player_df(df, player_name)
     if player_df is None:
-        return
+        return None
 
-    output_path = f"/tmp/{player_name}_volleyball_report.xlsx"
     overall_summary = []
 
     with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
@@ -43,12 +44,11 @@ def export_player_excel(df: pd.DataFrame, player_name: str):
 
         _write_summary_sheet(writer, overall_summary)
 
-    _download_excel(output_path, player_name)
+    return output_path
 
 def _prepare_player_df(df, player_name):
     player_df = df[df["player"] == player_name].copy()
     if player_df.empty:
-        st.error("No data for this player.")
         return None
 
     player_df["category"] = player_df["event"].apply(extract_category)
@@ -105,8 +105,6 @@ def _write_game_table(writer, sheet, cat_df, category, startrow):
 
 def _add_category_chart(writer, sheet, cat_df, category, startrow):
 
-    plt.rcParams["font.family"] = "DejaVu Sans"  # Hebrew-safe font
-
     ws = writer.book[sheet]
 
     percent_df = (
@@ -129,7 +127,9 @@ def _add_category_chart(writer, sheet, cat_df, category, startrow):
         ordered = [c for c in OUTCOME_ORDER[category] if c in pivot.columns]
         pivot = pivot[ordered + [c for c in pivot.columns if c not in ordered]]
 
-    fig, ax = plt.subplots(figsize=(10, 4))
+    # Figure API instead of pyplot: pyplot's global state is not thread-safe
+    fig = Figure(figsize=(10, 4))
+    ax = fig.subplots()
 
     for col in pivot.columns:
         y_values = pivot[col].values
@@ -166,11 +166,10 @@ def _add_category_chart(writer, sheet, cat_df, category, startrow):
     bbox_to_anchor=(1.02, 0.5),
     borderaxespad=0
     )
-    plt.tight_layout()
+    fig.tight_layout()
 
     img = BytesIO()
-    plt.savefig(img, dpi=150)
-    plt.close(fig)
+    fig.savefig(img, dpi=150)
     img.seek(0)
 
     xl_img = XLImage(img)
@@ -197,29 +196,27 @@ def _auto_adjust_columns(writer, sheet):
         ws.column_dimensions[get_column_letter(col[0].column)].width = width
 
 
-def _download_excel(path, player):
-    st.success("✅ Excel report created!")
-    with open(path, "rb") as f:
-        st.download_button(
-            "⬇️ Download Excel",
-            f,
-            file_name=f"{player}_volleyball_report.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+def build_events_excel(df, output_path):
+    # Exports exactly the frame given, so the file matches the data a job was keyed on
+    write_events_excel([df], output_path)
+    return output_path
 
 
-def export_all_events_excel(df):
-    output_path = "/tmp/volleyball_events.xlsx"
-    df.to_excel(output_path, index=False)
+# Takes any iterable of DataFrame chunks, e.g. supabase_service.iter_events(),
+# and streams them into a write-only workbook one chunk at a time
+def write_events_excel(chunks, output_path):
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Sheet1")
+    columns = None
 
-    with open(output_path, "rb") as f:
-        st.download_button(
-            "⬇️ Download All Events (Excel)",
-            f,
-            file_name="volleyball_events.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-            use_container_width=True
-        )
+    for chunk in chunks:
+        if columns is None:
+            columns = list(chunk.columns)
+            ws.append(columns)
+        for row in chunk.reindex(columns=columns).itertuples(index=False):
+            ws.append([None if pd.isna(v) else v for v in row])
+
+    wb.save(output_path)
 
 def _write_summary_sheet(writer, rows):
     df = pd.DataFrame(rows)
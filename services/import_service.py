@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+import requests
+from openpyxl import load_workbook
+from openpyxl.utils.exceptions import InvalidFileException
+from zipfile import BadZipFile
+
+from services.supabase_service import insert_events
+from utils.constants import (
+    ATTACK_TYPES, EVENT_OUTCOMES, LEGACY_OUTCOMES, PLAYERS, SET_TO, SPIKE_OUTCOMES
+)
+
+
+# Errors that can stop reading partway through a file
+READ_ERRORS = (
+    UnicodeDecodeError, pd.errors.ParserError, pd.errors.EmptyDataError,
+    InvalidFileException, BadZipFile
+)
+
+# Columns save_event always writes; optional ones are only sent when the file has them
+IMPORT_COLUMNS = [
+    "player", "event", "attack_type", "set_to", "outcome",
+    "game_name", "set_number", "video_url"
+]
+OPTIONAL_COLUMNS = ["notes"]
+
+# Case-insensitive lookups to the canonical spelling
+_PLAYERS = {p.lower(): p for p in PLAYERS if p}
+_EVENTS = {e.lower(): e for e in EVENT_OUTCOMES}
+_ATTACK_TYPES = {a.lower(): a for a in ATTACK_TYPES}
+_SET_TO = {p.lower(): p for p in SET_TO}
+_OUTCOMES = {
+    (event, o.lower()): o
+    for event, outcomes in EVENT_OUTCOMES.items()
+    for o in outcomes + (SPIKE_OUTCOMES if event == "Attack" else [])
+}
+_OUTCOMES.update({
+    (event, legacy.lower()): current
+    for (event, legacy), current in LEGACY_OUTCOMES.items()
+})
+
+
+@dataclass
+class ImportResult:
+    inserted: int = 0
+    rows_read: int = 0
+    read_error: str = None
+    rejected: list = field(default_factory=list)
+    failed_batches: list = field(default_factory=list)
+
+    @property
+    def rejected_df(self):
+        return pd.concat(self.rejected, ignore_index=True) if self.rejected else pd.DataFrame()
+
+
+def read_chunks(file, filename, chunk_size=5000):
+    if filename.lower().endswith((".xlsx", ".xlsm")):
+        yield from _read_excel_chunks(file, chunk_size)
+    else:
+        yield from pd.read_csv(file, dtype=str, chunksize=chunk_size)
+
+
+def _read_excel_chunks(file, chunk_size):
+    # pandas cannot chunk Excel files; a read-only workbook streams rows instead
+    wb = load_workbook(file, read_only=True, data_only=True)
+    rows = wb.active.iter_rows(values_only=True)
+    header = [str(c) if c is not None else "" for c in next(rows, [])]
+
+    batch = []
+    start = 0
+    for row in rows:
+        batch.append([None if v is None else str(v) for v in row])
+        if len(batch) == chunk_size:
+            yield _excel_frame(batch, header, start)
+            start += len(batch)
+            batch = []
+    if batch:
+        yield _excel_frame(batch, header, start)
+    wb.close()
+
+
+def _excel_frame(batch, header, start):
+    # Keep the index as the row position in the file, like read_csv chunks do
+    return pd.DataFrame(batch, columns=header, index=range(start, start + len(batch)))
+
+
+# Splits a raw chunk into (valid rows ready to insert, rejected rows with a reason)
+def validate_chunk(chunk):
+    chunk = chunk.rename(columns=lambda c: str(c).strip().lower().replace(" ", "_"))
+    chunk = chunk.loc[:, ~chunk.columns.duplicated()]
+    columns = IMPORT_COLUMNS + [c for c in OPTIONAL_COLUMNS if c in chunk.columns]
+    raw = chunk.reindex(columns=columns).astype(object)
+    text = raw.apply(lambda col: col.str.strip()).replace("", np.nan)
+
+    # Legacy rows may carry the attack type in the event, e.g. "Attack (Spike)"
+    parts = text["event"].str.extract(r"^([^(]*?)\s*(?:\((.*)\))?$")
+    event = parts[0].str.lower().map(_EVENTS)
+    raw_attack_type = text["attack_type"].fillna(parts[1].where(event == "Attack"))
+
+    # Sub-choices only apply to their own event and are dropped elsewhere
+    is_attack = event == "Attack"
+    is_set = event == "Set"
+    raw_attack_type = raw_attack_type.where(is_attack)
+    raw_set_to = text["set_to"].where(is_set)
+    attack_type = raw_attack_type.str.lower().map(_ATTACK_TYPES)
+    set_to = raw_set_to.str.lower().map(_SET_TO)
+
+    player = text["player"].str.lower().map(_PLAYERS)
+    outcome = pd.Series(
+        pd.MultiIndex.from_arrays([event, text["outcome"].str.lower()]).map(_OUTCOMES.get),
+        index=text.index
+    )
+    spike_only = outcome.isin(SPIKE_OUTCOMES) & (attack_type != "Spike")
+    outcome = outcome.mask(spike_only)
+
+    reason = np.select(
+        [
+            player.isna(),
+            event.isna(),
+            raw_attack_type.notna() & attack_type.isna(),
+            raw_set_to.notna() & set_to.isna(),
+            outcome.isna()
+        ],
+        [
+            "unknown player",
+            "unknown event",
+            "unknown attack type",
+            "unknown set to",
+            "outcome not valid for event"
+        ],
+        default=""
+    )
+    valid = reason == ""
+
+    rows = text.assign(
+        player=player, event=event, attack_type=attack_type, set_to=set_to, outcome=outcome
+    )[valid]
+    rows["game_name"] = rows["game_name"].fillna("No Game Entered")
+    rows = rows.astype(object).where(rows.notna(), None)
+
+    # Spreadsheet row number: 1-based plus the header line
+    rejected = chunk[~valid].assign(reason=reason[~valid])
+    rejected.insert(0, "row", rejected.index + 2)
+    return rows, rejected
+
+
+def import_events(file, filename, chunk_size=5000, batch_size=1000, workers=4, progress=None):
+    result = ImportResult()
+    in_flight = {}
+
+    def collect(done):
+        for future in done:
+            count = in_flight.pop(future)
+            try:
+                r = future.result()
+            except requests.RequestException as e:
+                result.failed_batches.append((count, str(e)))
+            else:
+                if r.ok:
+                    result.inserted += count
+                else:
+                    result.failed_batches.append((count, r.text))
+            if progress:
+                progress(result)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        try:
+            for chunk in read_chunks(file, filename, chunk_size):
+                result.rows_read += len(chunk)
+                rows, rejected = validate_chunk(chunk)
+                if not rejected.empty:
+                    result.rejected.append(rejected)
+
+                records = rows.to_dict("records")
+                for start in range(0, len(records), batch_size):
+                    batch = records[start:start + batch_size]
+                    future = pool.submit(insert_events, batch, "import_events")
+                    in_flight[future] = len(batch)
+
+                # Bound memory: don't read further ahead than the pool can insert
+                while len(in_flight) > workers * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    collect(done)
+        except READ_ERRORS as e:
+            # Batches already read still get inserted; report where reading stopped
+            result.read_error = f"{type(e).__name__}: {e}"
+
+        collect(wait(in_flight).done)
+
+    return result
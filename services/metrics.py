@@ -0,0 +1,147 @@
+import os
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+
+
+# Request metrics for the Supabase client: per-operation counters, errors by
+# status code, bytes transferred and latency histograms. Read them with
+# snapshot() or render_prometheus(); set SUPABASE_METRICS_FILE to have them
+# written as a Prometheus textfile (node_exporter textfile collector format)
+# every SUPABASE_METRICS_INTERVAL seconds by a background thread.
+
+LATENCY_BUCKETS = (0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_FILE = os.environ.get("SUPABASE_METRICS_FILE")
+METRICS_INTERVAL = float(os.environ.get("SUPABASE_METRICS_INTERVAL", 15))
+
+_lock = threading.Lock()
+
+
+def _new_operation():
+    return {
+        "requests": 0,
+        "errors": defaultdict(int),
+        "bytes_sent": 0,
+        "bytes_received": 0,
+        "latency_sum": 0.0,
+        "latency_buckets": [0] * (len(LATENCY_BUCKETS) + 1),
+    }
+
+
+_operations = defaultdict(_new_operation)
+
+
+def record(operation, status, seconds, bytes_sent=0, bytes_received=0, ok=True):
+    with _lock:
+        op = _operations[operation]
+        op["requests"] += 1
+        if not ok:
+            op["errors"][str(status)] += 1
+        op["bytes_sent"] += bytes_sent
+        op["bytes_received"] += bytes_received
+        op["latency_sum"] += seconds
+        op["latency_buckets"][bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+def snapshot():
+    with _lock:
+        result = {}
+        for name, op in _operations.items():
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), op["latency_buckets"]):
+                cumulative += count
+                buckets[bound] = cumulative
+            result[name] = {
+                "requests": op["requests"],
+                "errors": dict(op["errors"]),
+                "bytes_sent": op["bytes_sent"],
+                "bytes_received": op["bytes_received"],
+                "latency_seconds": {
+                    "count": op["requests"],
+                    "sum": op["latency_sum"],
+                    "buckets": buckets,
+                },
+            }
+        return result
+
+
+def reset():
+    with _lock:
+        _operations.clear()
+
+
+def render_prometheus():
+    snap = snapshot()
+    lines = [
+        "# HELP supabase_requests_total Requests sent to Supabase.",
+        "# TYPE supabase_requests_total counter",
+    ]
+    for name, op in snap.items():
+        lines.append(f'supabase_requests_total{{operation="{name}"}} {op["requests"]}')
+
+    lines += [
+        "# HELP supabase_request_errors_total Failed Supabase requests by status code.",
+        "# TYPE supabase_request_errors_total counter",
+    ]
+    for name, op in snap.items():
+        for status, count in sorted(op["errors"].items()):
+            lines.append(
+                f'supabase_request_errors_total{{operation="{name}",status="{status}"}} {count}'
+            )
+
+    for direction in ("sent", "received"):
+        lines += [
+            f"# HELP supabase_bytes_{direction}_total Payload bytes {direction}.",
+            f"# TYPE supabase_bytes_{direction}_total counter",
+        ]
+        for name, op in snap.items():
+            lines.append(
+                f'supabase_bytes_{direction}_total{{operation="{name}"}} {op[f"bytes_{direction}"]}'
+            )
+
+    lines += [
+        "# HELP supabase_request_duration_seconds Supabase request latency.",
+        "# TYPE supabase_request_duration_seconds histogram",
+    ]
+    for name, op in snap.items():
+        latency = op["latency_seconds"]
+        for bound, count in latency["buckets"].items():
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(
+                f'supabase_request_duration_seconds_bucket{{operation="{name}",le="{le}"}} {count}'
+            )
+        lines.append(
+            f'supabase_request_duration_seconds_sum{{operation="{name}"}} {latency["sum"]:.6f}'
+        )
+        lines.append(
+            f'supabase_request_duration_seconds_count{{operation="{name}"}} {latency["count"]}'
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path):
+    # Write-then-rename so a scraper never reads a half-written file
+    tmp_path = f"{path}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "w") as f:
+        f.write(render_prometheus())
+    os.replace(tmp_path, path)
+
+
+def _write_periodically(path, interval):
+    while True:
+        try:
+            write_prometheus(path)
+        except OSError:
+            pass
+        time.sleep(interval)
+
+
+if METRICS_FILE:
+    threading.Thread(
+        target=_write_periodically,
+        args=(METRICS_FILE, METRICS_INTERVAL),
+        daemon=True
+    ).start()
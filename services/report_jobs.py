@@ -0,0 +1,116 @@
+import itertools
+import os
+import queue
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+
+# In-process scheduler for report generation. Jobs run on a small fixed pool of
+# worker threads so heavy exports can't crowd out tagging sessions, identical
+# requests (same key) share one job, and lower priority values run first.
+
+PRIORITY_CURRENT_GAME = 0
+PRIORITY_DEFAULT = 10
+
+MAX_WORKERS = 2
+MAX_FINISHED_JOBS = 32
+
+
+class ReportJob:
+    def __init__(self, key, fn, args, priority, file_name):
+        self.key = key
+        self.fn = fn
+        self.args = args
+        self.priority = priority
+        self.file_name = file_name
+        self.status = "queued"
+        self.path = None
+        self.error = None
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    @property
+    def pending(self):
+        return self.status in ("queued", "running")
+
+
+class ReportScheduler:
+    def __init__(self, max_workers=MAX_WORKERS, max_finished=MAX_FINISHED_JOBS):
+        self._lock = threading.Lock()
+        self._queue = queue.PriorityQueue()
+        self._seq = itertools.count()
+        self._jobs = OrderedDict()
+        self._max_workers = max_workers
+        self._max_finished = max_finished
+        self._workers = []
+
+    def submit(self, key, fn, *args, priority=PRIORITY_DEFAULT, file_name="report.xlsx"):
+        # fn is called as fn(*args, output_path) and returns the path, or None if
+        # there was nothing to report
+        with self._lock:
+            job = self._jobs.get(key)
+            if job is not None and job.status != "failed":
+                if job.status == "queued" and priority < job.priority:
+                    # Re-queue at the higher priority; the stale entry is skipped
+                    job.priority = priority
+                    self._queue.put((priority, next(self._seq), job))
+                return job
+
+            job = ReportJob(key, fn, args, priority, file_name)
+            self._jobs[key] = job
+            self._queue.put((priority, next(self._seq), job))
+            self._start_workers()
+            return job
+
+    def _start_workers(self):
+        while len(self._workers) < self._max_workers:
+            worker = threading.Thread(target=self._work, daemon=True)
+            worker.start()
+            self._workers.append(worker)
+
+    def _work(self):
+        while True:
+            priority, _, job = self._queue.get()
+            with self._lock:
+                if job.status != "queued" or priority != job.priority:
+                    continue
+                job.status = "running"
+
+            fd, output_path = tempfile.mkstemp(suffix=os.path.splitext(job.file_name)[1])
+            os.close(fd)
+            try:
+                job.path = job.fn(*job.args, output_path)
+                job.status = "done"
+            except Exception as e:
+                job.error = str(e)
+                job.status = "failed"
+            job.finished_at = time.time()
+            # Args can hold a full events frame; a finished job only needs its result
+            job.fn = job.args = None
+            if job.path is None:
+                os.remove(output_path)
+
+            with self._lock:
+                self._evict_finished()
+
+    def _evict_finished(self):
+        finished = [k for k, j in self._jobs.items() if not j.pending]
+        for key in finished[:max(0, len(finished) - self._max_finished)]:
+            job = self._jobs.pop(key)
+            if job.path and os.path.exists(job.path):
+                os.remove(job.path)
+
+
+def data_fingerprint(df):
+    # Cheap content hash so reports built from identical data share a job
+    if df.empty:
+        return 0
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+# One scheduler per server process, shared by every session
+scheduler = ReportScheduler()
@@ -1,63 +1,140 @@
 import json
+import time
 import requests
 import pandas as pd
 from config.supabase import SUPABASE_URL, TABLE_NAME, HEADERS
+from services import metrics
 import streamlit as st
 
+# Seconds; a hung connection must fail rather than block a session forever
+REQUEST_TIMEOUT = 30
+
+
+def _request(operation, method, url, **kwargs):
+    start = time.perf_counter()
+    try:
+        r = requests.request(method, url, timeout=REQUEST_TIMEOUT, **kwargs)
+    except requests.RequestException:
+        metrics.record(operation, "exception", time.perf_counter() - start, ok=False)
+        raise
+
+    body = kwargs.get("data") or b""
+    metrics.record(
+        operation,
+        r.status_code,
+        time.perf_counter() - start,
+        bytes_sent=len(body.encode() if isinstance(body, str) else body),
+        bytes_received=len(r.content),
+        ok=r.ok
+    )
+    return r
+
+
 def save_event(data):
-    r = requests.post(
+    r = _request(
+        "save_event",
+        "POST",
         f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}",
         headers=HEADERS,
         data=json.dumps(data)
     )
     if r.status_code not in (200, 201):
-        st.error(res.text)
+        st.error(r.text)
     return r
 
+# Bulk insert: PostgREST accepts a JSON array and inserts it in one statement
+def save_events(rows):
+    r = insert_events(rows)
+    if r.status_code not in (200, 201):
+        st.error(r.text)
+    return r
+
+# Streamlit-free variant of save_events, safe to call from worker threads
+def insert_events(rows, operation="save_events"):
+    return _request(
+        operation,
+        "POST",
+        f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}",
+        headers=HEADERS,
+        data=json.dumps(rows)
+    )
+
 # @st.cache_data(ttl=60)
 def load_events():
-    all_rows = []
-    start = 0
-    batch_size = 1000
+    df, error = fetch_events()
+    if error:
+        st.error(error)
+    return df
+
+
+# Streamlit-free variant of load_events, safe to call from a background thread.
+# Returns the rows fetched so far plus the error text of the failing page, if any.
+def fetch_events():
+    chunks = []
+    try:
+        for chunk in iter_events():
+            chunks.append(chunk)
+    except requests.HTTPError as e:
+        return _concat_chunks(chunks), e.response.text
+
+    return _concat_chunks(chunks), None
+
+
+# Yields the table newest-first as DataFrame chunks of at most chunk_size rows.
+# Pages by id cursor (id=lt.<last id>) rather than offset so every page is an
+# index seek, and callers that consume chunks as they arrive only ever hold one.
+# Raises requests.HTTPError if a page fails.
+def iter_events(chunk_size=1000, columns="*"):
+    if columns != "*" and "id" not in columns.split(","):
+        columns = f"id,{columns}"
+    last_id = None
 
     while True:
-        headers = {
-            **HEADERS,
-            "Range": f"{start}-{start + batch_size - 1}"
-        }
-
-        r = requests.get(
-            f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}?select=*&order=id.desc",
-            headers=headers
+        url = (
+            f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}"
+            f"?select={columns}&order=id.desc&limit={chunk_size}"
         )
+        if last_id is not None:
+            url += f"&id=lt.{last_id}"
 
-        if r.status_code != 200:
-            st.error(r.text)
-            break
+        r = _request("load_events", "GET", url, headers=HEADERS)
+        if not r.ok:
+            raise requests.HTTPError(r.text, response=r)
 
         data = r.json()
         if not data:
-            break
+            return
+
+        yield pd.DataFrame(data)
+
+        # Only an empty page ends the table: PostgREST may cap pages below
+        # chunk_size (max-rows), so a short page doesn't mean the last one
+        last_id = data[-1]["id"]
 
-        all_rows.extend(data)
-        start += batch_size
 
-    return pd.DataFrame(all_rows)
+def _concat_chunks(chunks):
+    return pd.concat(chunks, ignore_index=True) if chunks else pd.DataFrame()
 
 
 def update_event(row_id, updated_data):
-    requests.patch(
+    r = _request(
+        "update_event",
+        "PATCH",
         f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}?id=eq.{row_id}",
         headers=HEADERS,
         data=json.dumps(updated_data)
     )
+    if r.status_code not in (200, 204):
+        st.error(r.text)
+    return r
 
 def delete_event(row_id):
-    requests.delete(
+    r = _request(
+        "delete_event",
+        "DELETE",
         f"{SUPABASE_URL}/rest/v1/{TABLE_NAME}?id=eq.{row_id}",
         headers=HEADERS
     )
-
-
-
-
+    if r.status_code not in (200, 204):
+        st.error(r.text)
+    return r
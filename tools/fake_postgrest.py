@@ -0,0 +1,159 @@
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+
+# In-memory stand-in for the subset of PostgREST that services/supabase_service.py
+# talks to. Every request is delayed by the configured latency (± jitter) to mimic
+# the round trip to a hosted Supabase project.
+class FakePostgrest:
+    def __init__(self, latency_ms=0.0, jitter=0.2, host="127.0.0.1", port=0, max_rows=1000):
+        self.latency_ms = latency_ms
+        self.jitter = jitter
+        # Like PostgREST's db-max-rows: no response carries more rows than this
+        self.max_rows = max_rows
+        self.rows = {}
+        self.next_id = 1
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), _make_handler(self))
+        self.server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def seed(self, rows):
+        with self.lock:
+            for row in rows:
+                self._insert(row)
+
+    def delay(self):
+        if self.latency_ms <= 0:
+            return
+        factor = random.uniform(1 - self.jitter, 1 + self.jitter)
+        time.sleep(self.latency_ms * factor / 1000)
+
+    def _insert(self, row):
+        row = {**row, "id": self.next_id}
+        self.rows[self.next_id] = row
+        self.next_id += 1
+        return row
+
+
+def _parse_filters(query):
+    filters = {}
+    order = None
+    limit = None
+    select = "*"
+    for key, value in parse_qsl(query):
+        if key == "select":
+            select = value
+        elif key == "order":
+            order = value
+        elif key == "limit":
+            limit = int(value)
+        else:
+            op, _, operand = value.partition(".")
+            filters[key] = (op, operand)
+    return filters, order, limit, select
+
+
+def _matches(row, filters):
+    for col, (op, operand) in filters.items():
+        value = row.get(col)
+        if op == "eq" and str(value) != operand:
+            return False
+        if op == "lt" and not (value is not None and value < type(value)(operand)):
+            return False
+        if op == "gt" and not (value is not None and value > type(value)(operand)):
+            return False
+    return True
+
+
+def _make_handler(store):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def _reply(self, status, body=None, headers=None):
+            payload = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _read_body(self):
+            length = int(self.headers.get("Content-Length", 0))
+            return json.loads(self.rfile.read(length) or b"null")
+
+        def _select(self, filters):
+            return [row for row in store.rows.values() if _matches(row, filters)]
+
+        def do_GET(self):
+            store.delay()
+            filters, order, limit, select = _parse_filters(urlsplit(self.path).query)
+            with store.lock:
+                rows = self._select(filters)
+
+            if order:
+                col, _, direction = order.partition(".")
+                rows.sort(key=lambda r: r.get(col), reverse=direction == "desc")
+
+            total = len(rows)
+            range_header = self.headers.get("Range")
+            if range_header:
+                first, _, last = range_header.partition("-")
+                rows = rows[int(first):int(last) + 1]
+            if limit is not None:
+                rows = rows[:limit]
+            rows = rows[:store.max_rows]
+            if select != "*":
+                columns = select.split(",")
+                rows = [{col: row.get(col) for col in columns} for row in rows]
+
+            self._reply(200, rows, {"Content-Range": f"*/{total}"})
+
+        def do_POST(self):
+            store.delay()
+            body = self._read_body()
+            rows = body if isinstance(body, list) else [body]
+            with store.lock:
+                for row in rows:
+                    store._insert(row)
+            self._reply(201)
+
+        def do_PATCH(self):
+            store.delay()
+            filters, _, _, _ = _parse_filters(urlsplit(self.path).query)
+            changes = self._read_body()
+            with store.lock:
+                for row in self._select(filters):
+                    row.update(changes)
+            self._reply(204)
+
+        def do_DELETE(self):
+            store.delay()
+            filters, _, _, _ = _parse_filters(urlsplit(self.path).query)
+            with store.lock:
+                for row in self._select(filters):
+                    del store.rows[row["id"]]
+            self._reply(204)
+
+    return Handler
@@ -0,0 +1,178 @@
+import argparse
+import os
+import random
+import threading
+import time
+from collections import defaultdict
+
+import requests
+
+from tools.fake_postgrest import FakePostgrest
+from utils.constants import EVENT_OUTCOMES, PLAYERS
+
+
+# Simulates concurrent tagging/viewing sessions against a local PostgREST
+# stand-in and reports per-operation latency percentiles and throughput.
+#
+#   python -m tools.load_test --taggers 6 --viewers 20 --latency-ms 80 --duration 60
+
+
+def _random_event(game_name="Load Test"):
+    event = random.choice(list(EVENT_OUTCOMES))
+    return {
+        "player": random.choice(PLAYERS[1:]),
+        "event": event,
+        "attack_type": "Spike" if event == "Attack" else None,
+        "set_to": "Position 4" if event == "Set" else None,
+        "outcome": random.choice(EVENT_OUTCOMES[event]),
+        "game_name": game_name,
+        "set_number": random.choice(["1st Set", "2nd Set", "3rd Set"]),
+        "video_url": ""
+    }
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = max(0, int(round(pct / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+class _Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+
+    def timed(self, op, fn, *args):
+        # A transport failure counts as an error; the session keeps going
+        start = time.perf_counter()
+        try:
+            result = fn(*args)
+        except requests.RequestException:
+            result = None
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.latencies[op].append(elapsed * 1000)
+        if result is None:
+            self.error(op)
+        return result
+
+    def error(self, op):
+        with self.lock:
+            self.errors[op] += 1
+
+
+def _think(ms):
+    time.sleep(random.uniform(0.5, 1.5) * ms / 1000)
+
+
+def _load(service, recorder):
+    # fetch_events is load_events without the st.error, so failed pages are visible
+    result = recorder.timed("load_events", service.fetch_events)
+    if result is None:
+        return None
+    df, error = result
+    if error:
+        recorder.error("load_events")
+    return df
+
+
+def _tagger(service, recorder, stop, think_ms, update_ratio):
+    saved_ids = []
+    while not stop.is_set():
+        r = recorder.timed("save_event", service.save_event, _random_event())
+        if r is not None and not r.ok:
+            recorder.error("save_event")
+
+        # Every save is followed by a reload of the events table in the app
+        df = _load(service, recorder)
+        if df is not None and not df.empty:
+            saved_ids = df["id"].head(50).tolist()
+
+        if saved_ids and random.random() < update_ratio:
+            r = recorder.timed(
+                "update_event", service.update_event,
+                random.choice(saved_ids), {"outcome": "Good"}
+            )
+            if r is not None and not r.ok:
+                recorder.error("update_event")
+
+        _think(think_ms)
+
+
+def _viewer(service, recorder, stop, think_ms):
+    while not stop.is_set():
+        _load(service, recorder)
+        _think(think_ms)
+
+
+def _print_report(recorder, elapsed):
+    print(f"\n{'operation':<14}{'count':>8}{'errors':>8}{'p50 ms':>10}"
+          f"{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>9}")
+    for op in sorted(recorder.latencies):
+        samples = recorder.latencies[op]
+        print(
+            f"{op:<14}{len(samples):>8}{recorder.errors[op]:>8}"
+            f"{_percentile(samples, 50):>10.1f}"
+            f"{_percentile(samples, 95):>10.1f}"
+            f"{_percentile(samples, 99):>10.1f}"
+            f"{len(samples) / elapsed:>9.2f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline load test for the Supabase service")
+    parser.add_argument("--taggers", type=int, default=4)
+    parser.add_argument("--viewers", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=30, help="seconds")
+    parser.add_argument("--latency-ms", type=float, default=50, help="injected server latency")
+    parser.add_argument("--jitter", type=float, default=0.2, help="latency jitter as a fraction")
+    parser.add_argument("--seed-rows", type=int, default=2000, help="rows in the table at start")
+    parser.add_argument("--tagger-think-ms", type=float, default=2000)
+    parser.add_argument("--viewer-think-ms", type=float, default=5000)
+    parser.add_argument("--update-ratio", type=float, default=0.1)
+    args = parser.parse_args()
+
+    server = FakePostgrest(latency_ms=args.latency_ms, jitter=args.jitter).start()
+    server.seed(_random_event(game_name="Seed") for _ in range(args.seed_rows))
+
+    # The config module reads these at import time, so import the service afterwards
+    os.environ["SUPABASE_URL"] = server.url
+    os.environ.setdefault("SUPABASE_KEY", "load-test")
+    from services import supabase_service
+
+    recorder = _Recorder()
+    stop = threading.Event()
+    sessions = [
+        threading.Thread(
+            target=_tagger,
+            args=(supabase_service, recorder, stop, args.tagger_think_ms, args.update_ratio)
+        )
+        for _ in range(args.taggers)
+    ] + [
+        threading.Thread(
+            target=_viewer,
+            args=(supabase_service, recorder, stop, args.viewer_think_ms)
+        )
+        for _ in range(args.viewers)
+    ]
+
+    print(
+        f"{args.taggers} taggers, {args.viewers} viewers, {args.latency_ms:g} ms latency, "
+        f"{args.seed_rows} seed rows, {args.duration:g}s"
+    )
+    started = time.perf_counter()
+    for session in sessions:
+        session.start()
+    time.sleep(args.duration)
+    stop.set()
+    for session in sessions:
+        session.join()
+    elapsed = time.perf_counter() - started
+
+    server.stop()
+    _print_report(recorder, elapsed)
+
+
+if __name__ == "__main__":
+    main()
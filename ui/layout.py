@@ -1,5 +1,9 @@
+import os
+
 import streamlit as st
 
+EXCEL_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
 def setup_page():
     st.set_page_config(
         page_title="🏐 Volleyball Event Dashboard",
@@ -12,3 +16,60 @@ def setup_page():
         "selected_outcome", "attack_type", "set_to"
     ]:
         st.session_state.setdefault(key, "")
+
+    # Events tagged in rapid-tag mode, waiting for the end of the rally
+    st.session_state.setdefault("rally_buffer", [])
+    # Background report jobs this session is waiting on, by report name
+    st.session_state.setdefault("report_jobs", {})
+
+
+def render_sync_status(refresher):
+    # Poll faster while a refresh is in flight so the new data shows up promptly
+    run_every = 1 if refresher.refreshing else 10
+
+    @st.fragment(run_every=run_every)
+    def _sync_status():
+        if refresher.version != st.session_state.get("events_version"):
+            st.rerun()
+
+        status = f"🔄 Last synced {refresher.seconds_since_sync()} seconds ago"
+        if refresher.refreshing:
+            status += " · refreshing…"
+        st.caption(status)
+
+        if refresher.error:
+            st.caption(f"⚠️ Last refresh failed: {refresher.error}")
+
+    _sync_status()
+
+
+def render_report_job(job, label):
+    was_pending = job.pending
+
+    @st.fragment(run_every=1 if was_pending else None)
+    def _job_status():
+        # Full rerun once the job lands so the fragment stops polling
+        if was_pending and not job.pending:
+            st.rerun()
+
+        if job.status == "queued":
+            st.caption("⏳ Report queued…")
+        elif job.status == "running":
+            st.caption("⚙️ Building report…")
+        elif job.status == "failed":
+            st.error(f"❌ Report failed: {job.error}")
+        elif job.path is None:
+            st.warning("No data for this report.")
+        elif not os.path.exists(job.path):
+            st.info("Report expired, please prepare it again.")
+        else:
+            with open(job.path, "rb") as f:
+                st.download_button(
+                    label,
+                    f.read(),
+                    file_name=job.file_name,
+                    mime=EXCEL_MIME,
+                    use_container_width=True
+                )
+
+    _job_status()
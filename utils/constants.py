@@ -8,6 +8,13 @@ EVENT_OUTCOMES = {
     "Defense": ["Perfect", "Good", "Neutral", "Bad", "Overpass", "Failure"]
 }
 
+ATTACK_TYPES = ["Free Ball", "Tip", "Hole", "Spike"]
+
+SET_TO = ["Position 1", "Position 2", "Position 3", "Position 4", "Position 6"]
+
+# Extra outcomes offered only for Attack / Spike
+SPIKE_OUTCOMES = ["Hard Blocked", "Soft Blocked"]
+
 OUTCOME_ORDER = {
     "Defense": ["Perfect", "Good", "Neutral", "Bad", "Overpass", "Failure"],
     "Dig": ["Perfect", "Good", "Neutral", "Bad"],
@@ -19,3 +26,23 @@ PLAYERS = [
     "Omer Saar", "Omer", "Karat", "Lior", "Yonatan", "Ido", "Royi"
 ]
 
+# Outcomes that win the point / lose it for the tagged player, per category
+POINT_OUTCOMES = {
+    "Serve": ["Ace"],
+    "Attack": ["Success", "Blockout"],
+    "Block": ["Kill"]
+}
+
+ERROR_OUTCOMES = {
+    "Serve": ["Out", "Net"],
+    "Attack": ["Out", "Net", "Hard Blocked"],
+    "Block": ["Error"],
+    "Receive": ["Aced"],
+    "Set": ["Overset"],
+    "Defense": ["Failure"]
+}
+
+# Outcome names used by the old Dash app (app.py) that were later renamed
+LEGACY_OUTCOMES = {
+    ("Defense", "Error"): "Failure"
+}
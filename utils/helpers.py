@@ -2,6 +2,8 @@ import streamlit as st
 import arabic_reshaper
 from bidi.algorithm import get_display
 
+from utils.constants import EVENT_OUTCOMES, PLAYERS, SPIKE_OUTCOMES
+
 def horizontal_radio(label, options, session_key):
     current = st.session_state.get(session_key, options[0])
     return st.radio(
@@ -12,6 +14,36 @@ def horizontal_radio(label, options, session_key):
         key=session_key
     )
 
+def allowed_outcomes(event, attack_type=None):
+    outcomes = EVENT_OUTCOMES.get(event, [])
+    if event == "Attack" and attack_type == "Spike":
+        outcomes = outcomes + SPIKE_OUTCOMES
+    return outcomes
+
+
+def validate_event(row):
+    problems = []
+    player = row.get("player")
+    event = row.get("event")
+    outcome = row.get("outcome")
+
+    if not player:
+        problems.append("missing player")
+    elif player not in PLAYERS:
+        problems.append(f"unknown player '{player}'")
+
+    if not event:
+        problems.append("missing event")
+    elif event not in EVENT_OUTCOMES:
+        problems.append(f"unknown event '{event}'")
+
+    if not outcome:
+        problems.append("missing outcome")
+    elif event in EVENT_OUTCOMES and outcome not in allowed_outcomes(event, row.get("attack_type")):
+        problems.append(f"outcome '{outcome}' is not valid for {event}")
+
+    return problems
+
 def extract_category(event_value):
     return event_value.split("(")[0].strip() if "(" in event_value else event_value
 